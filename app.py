@@ -9,9 +9,6 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-import pandas as pd
-from datetime import datetime
-import logging
 from src.dashboard import render_dashboard
 from src.inventory_review import inventory_review_page
 from src.inventory_manager import InventoryManager
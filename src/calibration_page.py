@@ -2,83 +2,204 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta, date
 import logging
-import time
 import json
+from functools import lru_cache
+from collections import OrderedDict
+from .inventory_manager import mark_inventory_changed
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        """Serialize to a compact JSON string with orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        """Serialize to a compact JSON string with the stdlib encoder."""
+        return json.dumps(obj, separators=(',', ':'))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Minimum query length before the probe list is scanned
+MIN_SEARCH_LENGTH = 2
+
+# Number of recent queries whose match indices are kept for prefix reuse
+FILTER_CACHE_SIZE = 32
+
+# Number of matching probes rendered per results page
+SEARCH_PAGE_SIZE = 25
+
+# Byte-substring length used to index search text for candidate narrowing
+SEARCH_NGRAM = 3
+
+# Decimal places kept for stored readings; finer than any input widget step
+CALIBRATION_DECIMALS = 4
+
+# Status badges for search results; plain text, so no per-row HTML is needed
+_STATUS_BADGES = {
+    'Instock': '🟡 Instock',
+    'Calibrated': '🟢 Calibrated',
+    'Shipped': '🔵 Shipped',
+    'Scraped': '🔴 Scraped'
+}
+
 # Helper Functions
+def _inventory_lookups():
+    """Get this session's lookups derived from the inventory, reset when it changes."""
+    inventory_df = st.session_state.inventory
+    version = st.session_state.get('_inventory_version', 0)
+    lookups = st.session_state.get('_inventory_lookups')
+    # Holding the frame itself makes the identity check immune to id() reuse;
+    # the version covers in-place edits. Neither needs hashing the DataFrame.
+    if lookups is None or lookups['inventory'] is not inventory_df or lookups['version'] != version:
+        lookups = {'inventory': inventory_df, 'version': version}
+        st.session_state['_inventory_lookups'] = lookups
+        # Remembered match indices point into the previous search arrays
+        _reset_search_matches()
+    return lookups
+
+def _probe_index():
+    """Map serial numbers to full probe records for O(1) lookups."""
+    lookups = _inventory_lookups()
+    if 'probe_index' not in lookups:
+        inventory_df = lookups['inventory']
+        # Reversed so a duplicated serial resolves to its first row, like a mask lookup
+        lookups['probe_index'] = dict(zip(
+            inventory_df['Serial Number'].tolist()[::-1],
+            inventory_df.to_dict('records')[::-1]
+        ))
+    return lookups['probe_index']
+
+def _probe_row_labels():
+    """Map serial numbers to their inventory row labels for O(1) in-place updates."""
+    lookups = _inventory_lookups()
+    if 'row_labels' not in lookups:
+        inventory_df = lookups['inventory']
+        lookups['row_labels'] = dict(zip(
+            inventory_df['Serial Number'].tolist()[::-1],
+            inventory_df.index.tolist()[::-1]
+        ))
+    return lookups['row_labels']
+
 def find_probe(serial_number):
     """Find a probe in the inventory by serial number."""
     if 'inventory' not in st.session_state:
         return None
     
-    inventory_df = st.session_state.inventory
-    probe = inventory_df[inventory_df['Serial Number'] == serial_number]
-    return probe.iloc[0] if not probe.empty else None
+    # Hash lookup in the session's index instead of a full column scan
+    return _probe_index().get(serial_number)
+
+def _search_text_lower(inventory_df):
+    """Build each probe's lowercased search text column-wise instead of per row."""
+    search_text = (
+        inventory_df['Serial Number'].astype(str) + ' '
+        + inventory_df['Type'].astype(str) + ' '
+        + inventory_df['Manufacturer'].astype(str) + ' '
+        + inventory_df['Status'].astype(str)
+    )
+    return search_text.str.lower()
+
+def _build_search_arrays(inventory_df):
+    """Build the parallel column arrays the probe search filters and renders from."""
+    search_text_lower = _search_text_lower(inventory_df)
+    return {
+        'serial': inventory_df['Serial Number'].to_numpy(),
+        'type': inventory_df['Type'].astype(str).to_numpy(),
+        'status': inventory_df['Status'].astype(str).to_numpy(),
+        # Fixed-width UTF-8 byte array: substring matching runs in NumPy's C loop
+        # at one byte per ASCII character instead of four, and UTF-8 byte matches
+        # are exactly character matches
+        'search': np.array(search_text_lower.str.encode('utf-8').tolist(), dtype=bytes)
+    }
 
-def get_searchable_probes():
-    """Get list of searchable probes with their details."""
+def _build_search_index(search_texts):
+    """Map every search-text byte n-gram to the ascending indices of probes containing it."""
+    index = {}
+    for i, text in enumerate(search_texts):
+        for gram in {text[j:j + SEARCH_NGRAM] for j in range(len(text) - SEARCH_NGRAM + 1)}:
+            index.setdefault(gram, []).append(i)
+    return {gram: np.array(indices) for gram, indices in index.items()}
+
+def _search_arrays():
+    """Get the session's search column arrays, built once per inventory change."""
+    lookups = _inventory_lookups()
+    if 'search_arrays' not in lookups:
+        lookups['search_arrays'] = _build_search_arrays(lookups['inventory'])
+    return lookups['search_arrays']
+
+def _search_index():
+    """Get the session's search n-gram index, built once per inventory change."""
+    lookups = _inventory_lookups()
+    if 'search_index' not in lookups:
+        lookups['search_index'] = _build_search_index(_search_arrays()['search'])
+    return lookups['search_index']
+
+@lru_cache(maxsize=4096)
+def _parse_calibration_data(raw):
+    """Parse a stored Calibration Data JSON string, memoized per string."""
+    # Callers only read the returned dict, so sharing it between calls is safe.
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers that
+    # catch the stdlib error keep working with either parser.
+    return _json_loads(raw)
+
+def search_probe_indices(search_query, candidates=None):
+    """Get indices of probes matching the query, scanning only candidate indices if given."""
     if 'inventory' not in st.session_state:
-        return []
-    
-    inventory_df = st.session_state.inventory
-    searchable_probes = []
-    
-    for _, row in inventory_df.iterrows():
-        probe_info = {
-            'serial': row['Serial Number'],
-            'type': row['Type'],
-            'manufacturer': row['Manufacturer'],
-            'status': row['Status'],
-            'search_text': f"{row['Serial Number']} {row['Type']} {row['Manufacturer']} {row['Status']}"
-        }
-        searchable_probes.append(probe_info)
-    
-    return searchable_probes
+        return np.array([], dtype=int)
+
+    search_texts = _search_arrays()['search']
+    query = search_query.encode('utf-8')
+    if candidates is None and len(query) >= SEARCH_NGRAM:
+        # Any text containing the query contains its leading n-gram
+        candidates = _search_index().get(
+            query[:SEARCH_NGRAM], np.array([], dtype=int)
+        )
+    if candidates is None:
+        return np.flatnonzero(np.char.find(search_texts, query) >= 0)
+    return candidates[np.char.find(search_texts[candidates], query) >= 0]
+
+def _cached_match_candidates(search_query):
+    """Get cached match indices for the longest cached prefix of the query, if any."""
+    cache = st.session_state.get('_probe_filter_cache')
+    if not cache:
+        return None
+    # A longer query can only match a subset of its prefix's matches
+    for end in range(len(search_query), MIN_SEARCH_LENGTH - 1, -1):
+        indices = cache.get(search_query[:end])
+        if indices is not None:
+            return indices
+    return None
+
+def _remember_matches(search_query, indices):
+    """Store match indices for a query, evicting the least recently used beyond the cap."""
+    cache = st.session_state.setdefault('_probe_filter_cache', OrderedDict())
+    cache[search_query] = indices
+    cache.move_to_end(search_query)
+    while len(cache) > FILTER_CACHE_SIZE:
+        cache.popitem(last=False)
+
+def _reset_search_matches():
+    """Forget cached search matches so the next query scans the current inventory."""
+    st.session_state.pop('_match_query', None)
+    st.session_state.pop('_probe_filter_cache', None)
 
 # Display Functions for Shipped Probes
 def display_shipped_probe_info(probe):
     """Display detailed information for shipped probes."""
-    st.markdown("""
-        <style>
-            .shipped-probe-card {
-                background: #f8f9fa;
-                padding: 20px;
-                border-radius: 10px;
-                border-left: 4px solid #4169E1;
-                margin: 20px 0;
-            }
-            .calibration-details {
-                background: white;
-                padding: 15px;
-                border-radius: 8px;
-                margin-top: 15px;
-                box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            }
-            .info-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                gap: 15px;
-                margin-top: 10px;
-            }
-        </style>
-    """, unsafe_allow_html=True)
-
-    st.markdown("""
-        <div class="shipped-probe-card">
-            <h3 style="color: #4169E1; margin-top: 0;">📦 Shipped Probe Information</h3>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SHIPPED_PROBE_HEADER, unsafe_allow_html=True)
 
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown("#### 📋 Probe Details")
         st.markdown(f"""
+            #### 📋 Probe Details
             - **Serial Number:** {probe['Serial Number']}
             - **Type:** {probe['Type']}
             - **Manufacturer:** {probe['Manufacturer']}
@@ -86,26 +207,24 @@ def display_shipped_probe_info(probe):
         """)
 
     with col2:
-        st.markdown("#### 📅 Calibration Timeline")
         st.markdown(f"""
+            #### 📅 Calibration Timeline
             - **Last Calibration:** {probe.get('Last Modified', 'N/A')}
             - **Next Calibration Due:** {probe.get('Next Calibration', 'N/A')}
             - **Calibrated By:** {probe.get('Operator', 'N/A')}
         """)
 
-    if 'Calibration Data' in probe and probe['Calibration Data']:
+    # Only a JSON object can be a calibration record; blanks and stray sheet
+    # values (numbers, 'nan') skip the parser instead of raising every rerun
+    raw_cal_data = probe.get('Calibration Data')
+    if isinstance(raw_cal_data, str) and raw_cal_data.lstrip().startswith('{'):
         try:
-            cal_data = json.loads(probe['Calibration Data'])
+            cal_data = _parse_calibration_data(raw_cal_data)
             st.markdown("#### 📊 Final Calibration Results")
-            
-            if probe['Type'] == "pH Probe":
-                display_ph_calibration_data(cal_data)
-            elif probe['Type'] == "DO Probe":
-                display_do_calibration_data(cal_data)
-            elif probe['Type'] == "ORP Probe":
-                display_orp_calibration_data(cal_data)
-            elif probe['Type'] == "EC Probe":
-                display_ec_calibration_data(cal_data)
+
+            display = _DISPLAY_RENDERERS.get(probe['Type'])
+            if display:
+                display(cal_data)
 
         except json.JSONDecodeError:
             st.error("Error loading calibration data")
@@ -114,24 +233,34 @@ def display_shipped_probe_info(probe):
 
 # Calibration Data Display Functions
 
+# Buffers (with their record keys) and standards shown in a shipped probe's calibration record
+_PH_DISPLAY_BUFFERS = tuple(
+    (buffer, f"{buffer}_initial", f"{buffer}_initial_mv", f"{buffer}_control",
+     f"{buffer}_calibrated", f"{buffer}_calibrated_mv")
+    for buffer in ("pH 4", "pH 7", "pH 10")
+)
+_EC_DISPLAY_STANDARDS = (
+    ("84 µS/cm", "84"),
+    ("1413 µS/cm", "1413"),
+    ("12.88 mS/cm", "12880")
+)
+
 def display_ph_calibration_data(cal_data):
     """Display pH probe calibration data."""
-    buffers = ["pH 4", "pH 7", "pH 10"]
-    
-    for buffer in buffers:
-        if f"{buffer}_initial" in cal_data:
+    for buffer, initial, initial_mv, control, calibrated, calibrated_mv in _PH_DISPLAY_BUFFERS:
+        if initial in cal_data:
             with st.expander(f"{buffer} Buffer Results", expanded=True):
                 col1, col2 = st.columns(2)
                 with col1:
                     st.markdown(f"""
-                        - Initial pH: {cal_data.get(f'{buffer}_initial', 'N/A')}
-                        - Initial mV: {cal_data.get(f'{buffer}_initial_mv', 'N/A')}
-                        - Solution Control #: {cal_data.get(f'{buffer}_control', 'N/A')}
+                        - Initial pH: {cal_data[initial]}
+                        - Initial mV: {cal_data.get(initial_mv, 'N/A')}
+                        - Solution Control #: {cal_data.get(control, 'N/A')}
                     """)
                 with col2:
                     st.markdown(f"""
-                        - Final pH: {cal_data.get(f'{buffer}_calibrated', 'N/A')}
-                        - Final mV: {cal_data.get(f'{buffer}_calibrated_mv', 'N/A')}
+                        - Final pH: {cal_data.get(calibrated, 'N/A')}
+                        - Final mV: {cal_data.get(calibrated_mv, 'N/A')}
                         - Temperature: {cal_data.get('temperature', 'N/A')}°C
                     """)
 
@@ -196,16 +325,10 @@ def display_orp_calibration_data(cal_data):
 
 def display_ec_calibration_data(cal_data):
     """Display EC probe calibration data."""
-    standards = [
-        ("84 µS/cm", "84"),
-        ("1413 µS/cm", "1413"),
-        ("12.88 mS/cm", "12880")
-    ]
-
     st.markdown("##### 🌡️ Calibration Temperature")
     st.markdown(f"- Temperature: {cal_data.get('temperature', 'N/A')}°C")
 
-    for std_name, std_key in standards:
+    for std_name, std_key in _EC_DISPLAY_STANDARDS:
         if f"{std_key}_initial" in cal_data:
             with st.expander(f"{std_name} Standard Results", expanded=True):
                 col1, col2 = st.columns(2)
@@ -220,37 +343,49 @@ def display_ec_calibration_data(cal_data):
                         - Solution Expiry: {cal_data.get(f'{std_key}_exp', 'N/A')}
                     """)
 
+# Calibration record display per probe type
+_DISPLAY_RENDERERS = {
+    "pH Probe": display_ph_calibration_data,
+    "DO Probe": display_do_calibration_data,
+    "ORP Probe": display_orp_calibration_data,
+    "EC Probe": display_ec_calibration_data
+}
 
 def update_probe_calibration(serial_number, calibration_data):
     try:
-        if serial_number not in st.session_state.inventory['Serial Number'].values:
+        probe_idx = _probe_row_labels().get(serial_number)
+        if probe_idx is None:
             st.error(f"Serial number {serial_number} not found in inventory")
             return False
-            
-        probe_idx = st.session_state.inventory[
-            st.session_state.inventory['Serial Number'] == serial_number
-        ].index[0]
 
         # Convert date objects to strings
         for key, value in calibration_data.items():
             if isinstance(value, date):
                 calibration_data[key] = value.strftime('%Y-%m-%d')
-            elif isinstance(value, float) and pd.isna(value):
-                calibration_data[key] = ''
+            elif isinstance(value, float):
+                # Trim binary float noise (e.g. 7.010000000000001) from the stored JSON
+                calibration_data[key] = '' if pd.isna(value) else round(value, CALIBRATION_DECIMALS)
+
+        # Take the clock once so every stamp written below agrees
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
 
         # Add metadata
-        calibration_data['calibration_date'] = datetime.now().strftime("%Y-%m-%d")
+        calibration_data['calibration_date'] = today
         calibration_data['operator'] = st.session_state.get('username', 'Unknown')
         
         # Update the DataFrame
-        st.session_state.inventory.at[probe_idx, 'Calibration Data'] = json.dumps(calibration_data)
-        st.session_state.inventory.at[probe_idx, 'Last Modified'] = datetime.now().strftime("%Y-%m-%d")
+        # Compact JSON keeps the stored cell short; existing spaced JSON still parses
+        st.session_state.inventory.at[probe_idx, 'Calibration Data'] = _json_dumps(calibration_data)
+        st.session_state.inventory.at[probe_idx, 'Last Modified'] = today
         st.session_state.inventory.at[probe_idx, 'Next Calibration'] = (
-            datetime.now() + timedelta(days=365)
+            now + timedelta(days=365)
         ).strftime("%Y-%m-%d")
         st.session_state.inventory.at[probe_idx, 'Status'] = "Calibrated"
+        mark_inventory_changed()
         
-        return st.session_state.inventory_manager.save_inventory(st.session_state.inventory)
+        # Only this probe's row changed, so write just that row
+        return st.session_state.inventory_manager.save_probe(st.session_state.inventory, serial_number)
             
     except Exception as e:
         logger.error(f"Error updating calibration data: {str(e)}")
@@ -294,9 +429,87 @@ CALIBRATION_STYLES = """
         margin-bottom: 20px;
         border-left: 4px solid;
     }
+    .shipped-probe-card {
+        background: #f8f9fa;
+        padding: 20px;
+        border-radius: 10px;
+        border-left: 4px solid #4169E1;
+        margin: 20px 0;
+    }
+    .calibration-details {
+        background: white;
+        padding: 15px;
+        border-radius: 8px;
+        margin-top: 15px;
+        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    }
 </style>
 """
 
+# Page section headers (static HTML, styled by CALIBRATION_STYLES)
+_SHIPPED_PROBE_HEADER = """
+<div class="shipped-probe-card">
+    <h3 style="color: #4169E1; margin-top: 0;">📦 Shipped Probe Information</h3>
+</div>
+"""
+
+_PH_HEADER = """
+<div class='calibration-header'>
+    <h2 style='margin:0;'>🧪 pH Probe Calibration</h2>
+    <p style='margin:5px 0 0 0;'>Three-point calibration sequence for accurate pH measurement</p>
+</div>
+"""
+
+_DO_HEADER = """
+<div class='calibration-header'>
+    <h2 style='margin:0;'>💧 DO Probe Calibration</h2>
+    <p style='margin:5px 0 0 0;'>Two-point calibration for Dissolved Oxygen measurement (mg/L)</p>
+</div>
+"""
+
+_ORP_HEADER = """
+<div class='calibration-header'>
+    <h2 style='margin:0;'>⚡ ORP Probe Calibration</h2>
+    <p style='margin:5px 0 0 0;'>Single-point calibration for ORP measurement</p>
+</div>
+"""
+
+_EC_HEADER = """
+<div class='calibration-header'>
+    <h2 style='margin:0;'>🔌 EC Probe Calibration</h2>
+    <p style='margin:5px 0 0 0;'>Three-point calibration for Electrical Conductivity measurement</p>
+</div>
+"""
+
+# ORP standard info/tips card (static HTML)
+_ORP_STANDARD_CARD = """
+<div class='calibration-card' style='border-left-color: #9333ea;'>
+    <div class='info-grid'>
+        <div class='info-item'>
+            <strong>📊 Expected Range</strong><br/>
+            225 ±10 mV at 25°C
+        </div>
+        <div class='info-item'>
+            <strong>⏱️ Stability Time</strong><br/>
+            2-3 minutes
+        </div>
+        <div class='info-item'>
+            <strong>🎯 Target Value</strong><br/>
+            225 mV
+        </div>
+    </div>
+
+    <div class='tips-container'>
+        <strong>💡 Important Tips:</strong>
+        <ul>
+            <li>Ensure probe is clean and dry before calibration</li>
+            <li>Use fresh standard solution</li>
+            <li>Keep probe tip fully submerged</li>
+            <li>Wait for reading to stabilize</li>
+        </ul>
+    </div>
+"""
+
 
 def calculate_mv_from_ph(ph_value, temperature=25.0):
     """Calculate mV from pH using Nernst equation."""
@@ -309,14 +522,72 @@ def calculate_mv_from_ph(ph_value, temperature=25.0):
     except (ValueError, TypeError):
         return None
 
+# pH buffer configuration
+_PH_BUFFERS = (
+    {
+        "name": "pH 7",
+        "color": "#FFD700",
+        "icon": "⚖️",
+        "desc": "Neutral Buffer",
+        "range": "6.98 - 7.02",
+        "expected_mv": "0 ±30 mV",
+        "tips": (
+            "Always start with pH 7 buffer",
+            "Rinse probe with DI water before immersion",
+            "Wait for stable reading (±0.01 pH)",
+            "Record offset reading after calibration"
+        )
+    },
+    {
+        "name": "pH 4",
+        "color": "#FF6B6B",
+        "icon": "🔴",
+        "desc": "Acidic Buffer",
+        "range": "3.98 - 4.02",
+        "expected_mv": "+165 to +180 mV",
+        "tips": (
+            "Use after pH 7 calibration",
+            "Ensure thorough rinsing between buffers",
+            "Check for rapid response",
+            "Calculate slope after calibration"
+        )
+    },
+    {
+        "name": "pH 10",
+        "color": "#4ECDC4",
+        "icon": "🔵",
+        "desc": "Basic Buffer",
+        "range": "9.98 - 10.02",
+        "expected_mv": "-165 to -180 mV",
+        "tips": (
+            "Final calibration point",
+            "Most sensitive to temperature",
+            "Verify slope calculation",
+            "Record all final readings"
+        )
+    }
+)
+
+def _build_ph_buffer_text(buffer):
+    """Build the static heading, info and tips text for a pH buffer section."""
+    heading = f"### {buffer['icon']} {buffer['name']} Buffer Solution"
+    info = f"""
+            📊 Expected Range: {buffer['range']}  |  
+            ⚡ Expected mV: {buffer['expected_mv']}
+        """
+    # One markdown block per section; blank lines keep each tip its own paragraph
+    tips = "\n\n".join(f"• {tip}" for tip in buffer['tips'])
+    return heading, info, tips
+
+# pH buffer card text: buffer name -> (heading, info, tips)
+_PH_BUFFER_TEXT = {
+    buffer['name']: _build_ph_buffer_text(buffer)
+    for buffer in _PH_BUFFERS
+}
+
 def render_ph_calibration():
     """Render pH probe calibration form."""
-    st.markdown("""
-        <div style='background: linear-gradient(90deg, #0071ba, #00a6fb); color: white; padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
-            <h2 style='margin:0;'>🧪 pH Probe Calibration</h2>
-            <p style='margin:5px 0 0 0;'>Three-point calibration sequence for accurate pH measurement</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_PH_HEADER, unsafe_allow_html=True)
 
     ph_data = {}
 
@@ -335,65 +606,16 @@ def render_ph_calibration():
     with temp_col2:
         st.info("Optimal range: 20-25°C")
 
-    # Buffer configurations
-    buffers = [
-        {
-            "name": "pH 7",
-            "color": "#FFD700",
-            "icon": "⚖️",
-            "desc": "Neutral Buffer",
-            "range": "6.98 - 7.02",
-            "expected_mv": "0 ±30 mV",
-            "tips": [
-                "Always start with pH 7 buffer",
-                "Rinse probe with DI water before immersion",
-                "Wait for stable reading (±0.01 pH)",
-                "Record offset reading after calibration"
-            ]
-        },
-        {
-            "name": "pH 4",
-            "color": "#FF6B6B",
-            "icon": "🔴",
-            "desc": "Acidic Buffer",
-            "range": "3.98 - 4.02",
-            "expected_mv": "+165 to +180 mV",
-            "tips": [
-                "Use after pH 7 calibration",
-                "Ensure thorough rinsing between buffers",
-                "Check for rapid response",
-                "Calculate slope after calibration"
-            ]
-        },
-        {
-            "name": "pH 10",
-            "color": "#4ECDC4",
-            "icon": "🔵",
-            "desc": "Basic Buffer",
-            "range": "9.98 - 10.02",
-            "expected_mv": "-165 to -180 mV",
-            "tips": [
-                "Final calibration point",
-                "Most sensitive to temperature",
-                "Verify slope calculation",
-                "Record all final readings"
-            ]
-        }
-    ]
-
-    for buffer in buffers:
-        st.markdown(f"### {buffer['icon']} {buffer['name']} Buffer Solution")
+    for buffer in _PH_BUFFERS:
+        heading, info, tips = _PH_BUFFER_TEXT[buffer['name']]
+        st.markdown(heading)
         
         # Info grid
-        st.info(f"""
-            📊 Expected Range: {buffer['range']}  |  
-            ⚡ Expected mV: {buffer['expected_mv']}
-        """)
+        st.info(info)
 
         # Tips
         with st.expander("💡 Important Tips", expanded=True):
-            for tip in buffer['tips']:
-                st.markdown(f"• {tip}")
+            st.markdown(tips)
 
         col1, col2 = st.columns(2)
         with col1:
@@ -508,6 +730,60 @@ def render_ph_calibration():
         st.markdown("---")
 
     return ph_data
+
+# DO calibration points configuration
+_DO_CAL_POINTS = (
+    {
+        "name": "Zero Point",
+        "unit": "mg/L",
+        "color": "#FF6B6B",
+        "icon": "⭕",
+        "desc": "0 mg/L Calibration",
+        "range": "0.0 - 0.2 mg/L",
+        "expected": "0.0 mg/L",
+        "tips": (
+            "Use fresh sodium sulfite solution",
+            "Ensure probe tip is fully submerged",
+            "Stir gently to remove trapped bubbles",
+            "Wait for stable reading (2-3 minutes)",
+            "Verify zero point stability"
+        )
+    },
+    {
+        "name": "Saturation Point",
+        "unit": "mg/L",
+        "color": "#4ECDC4",
+        "icon": "💫",
+        "desc": "Saturation Calibration",
+        "range": "8.2 - 8.7 mg/L at 25°C",
+        "expected": "8.4 mg/L at 25°C",
+        "tips": (
+            "Use water-saturated air method",
+            "Keep probe in sealed, moist environment",
+            "Maintain stable temperature",
+            "Allow 3-5 minutes for stabilization",
+            "Avoid direct sunlight during calibration"
+        )
+    }
+)
+
+def _build_do_cal_point_text(point):
+    """Build the static heading, info and tips text for a DO calibration point."""
+    heading = f"### {point['icon']} {point['name']} Calibration ({point['unit']})"
+    info = f"""
+            📊 Expected Range: {point['range']}  |  
+            🎯 Target Value: {point['expected']}  |  
+            ⏱️ Stability Time: 2-3 minutes
+        """
+    tips = "\n\n".join(f"• {tip}" for tip in point['tips'])
+    return heading, info, tips
+
+# DO calibration point card text: point name -> (heading, info, tips)
+_DO_CAL_POINT_TEXT = {
+    point['name']: _build_do_cal_point_text(point)
+    for point in _DO_CAL_POINTS
+}
+
 def render_do_tips(tips, border_color):
     """Helper function to render tips properly"""
     tips_html = f"""
@@ -528,12 +804,7 @@ def render_do_tips(tips, border_color):
 
 def render_do_calibration():
     """Render DO probe calibration form."""
-    st.markdown("""
-        <div style='background: linear-gradient(90deg, #0071ba, #00a6fb); color: white; padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
-            <h2 style='margin:0;'>💧 DO Probe Calibration</h2>
-            <p style='margin:5px 0 0 0;'>Two-point calibration for Dissolved Oxygen measurement (mg/L)</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_DO_HEADER, unsafe_allow_html=True)
 
     do_data = {}
 
@@ -570,57 +841,17 @@ def render_do_calibration():
             help="Local atmospheric pressure affects DO saturation"
         )
 
-    # Calibration points configuration
-    cal_points = [
-        {
-            "name": "Zero Point",
-            "unit": "mg/L",
-            "color": "#FF6B6B",
-            "icon": "⭕",
-            "desc": "0 mg/L Calibration",
-            "range": "0.0 - 0.2 mg/L",
-            "expected": "0.0 mg/L",
-            "tips": [
-                "Use fresh sodium sulfite solution",
-                "Ensure probe tip is fully submerged",
-                "Stir gently to remove trapped bubbles",
-                "Wait for stable reading (2-3 minutes)",
-                "Verify zero point stability"
-            ]
-        },
-        {
-            "name": "Saturation Point",
-            "unit": "mg/L",
-            "color": "#4ECDC4",
-            "icon": "💫",
-            "desc": "Saturation Calibration",
-            "range": "8.2 - 8.7 mg/L at 25°C",
-            "expected": "8.4 mg/L at 25°C",
-            "tips": [
-                "Use water-saturated air method",
-                "Keep probe in sealed, moist environment",
-                "Maintain stable temperature",
-                "Allow 3-5 minutes for stabilization",
-                "Avoid direct sunlight during calibration"
-            ]
-        }
-    ]
-
     # Calibration sections for each point
-    for point in cal_points:
-        st.markdown(f"### {point['icon']} {point['name']} Calibration ({point['unit']})")
+    for point in _DO_CAL_POINTS:
+        heading, info, tips = _DO_CAL_POINT_TEXT[point['name']]
+        st.markdown(heading)
         
         # Info box
-        st.info(f"""
-            📊 Expected Range: {point['range']}  |  
-            🎯 Target Value: {point['expected']}  |  
-            ⏱️ Stability Time: 2-3 minutes
-        """)
+        st.info(info)
 
         # Tips section
         with st.expander("💡 Important Tips", expanded=True):
-            for tip in point['tips']:
-                st.markdown(f"• {tip}")
+            st.markdown(tips)
 
         # Input fields
         col1, col2 = st.columns(2)
@@ -678,14 +909,7 @@ def render_do_calibration():
 
 def render_orp_calibration():
     """Render ORP probe calibration form."""
-    st.markdown(CALIBRATION_STYLES, unsafe_allow_html=True)
-    
-    st.markdown("""
-        <div class='calibration-header'>
-            <h2 style='margin:0;'>⚡ ORP Probe Calibration</h2>
-            <p style='margin:5px 0 0 0;'>Single-point calibration for ORP measurement</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_ORP_HEADER, unsafe_allow_html=True)
 
     orp_data = {}
 
@@ -712,33 +936,7 @@ def render_orp_calibration():
 
     # ORP Calibration
     st.markdown("### ORP Standard Solution Calibration")
-    st.markdown("""
-        <div class='calibration-card' style='border-left-color: #9333ea;'>
-            <div class='info-grid'>
-                <div class='info-item'>
-                    <strong>📊 Expected Range</strong><br/>
-                    225 ±10 mV at 25°C
-                </div>
-                <div class='info-item'>
-                    <strong>⏱️ Stability Time</strong><br/>
-                    2-3 minutes
-                </div>
-                <div class='info-item'>
-                    <strong>🎯 Target Value</strong><br/>
-                    225 mV
-                </div>
-            </div>
-
-            <div class='tips-container'>
-                <strong>💡 Important Tips:</strong>
-                <ul>
-                    <li>Ensure probe is clean and dry before calibration</li>
-                    <li>Use fresh standard solution</li>
-                    <li>Keep probe tip fully submerged</li>
-                    <li>Wait for reading to stabilize</li>
-                </ul>
-            </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_ORP_STANDARD_CARD, unsafe_allow_html=True)
 
     col1, col2 = st.columns(2)
     with col1:
@@ -778,18 +976,95 @@ def render_orp_calibration():
 
     return orp_data
 
-def render_ec_calibration():
-    """Render EC probe calibration form."""
-    st.markdown(CALIBRATION_STYLES, unsafe_allow_html=True)
-    
-    st.markdown("""
-        <div class='calibration-header'>
-            <h2 style='margin:0;'>🔌 EC Probe Calibration</h2>
-            <p style='margin:5px 0 0 0;'>Three-point calibration for Electrical Conductivity measurement</p>
+# EC Standards Configuration
+_EC_STANDARDS = (
+    {
+        "name": "84 µS/cm",
+        "key": "84",
+        "color": "#4ECDC4",
+        "range": "80-88 µS/cm",
+        "unit": "µS/cm",
+        "tips": (
+            "Start with this lowest standard",
+            "Essential for low-range accuracy",
+            "Most sensitive to temperature",
+            "Wait for complete stability"
+        )
+    },
+    {
+        "name": "1413 µS/cm",
+        "key": "1413",
+        "color": "#FFD700",
+        "range": "1390-1436 µS/cm",
+        "unit": "µS/cm",
+        "tips": (
+            "Middle-range standard",
+            "Common measurement range",
+            "Check for consistent response",
+            "Verify temperature compensation"
+        )
+    },
+    {
+        "name": "12.88 mS/cm",
+        "key": "12880",
+        "color": "#FF6B6B",
+        "range": "12.75-13.01 mS/cm",
+        "unit": "mS/cm",
+        "tips": (
+            "Highest standard solution",
+            "Critical for high-range accuracy",
+            "Ensure complete rinsing from previous standards",
+            "Verify cell constant calculation"
+        )
+    }
+)
+
+# Acceptable final-reading range per EC standard: key -> (low, high, unit)
+_EC_VALIDATION_RANGES = {
+    '84': (80, 88, 'µS/cm'),
+    '1413': (1390, 1436, 'µS/cm'),
+    '12880': (12.75, 13.01, 'mS/cm')
+}
+
+# Per-standard widget fields persisted in the EC calibration record
+_EC_FIELDS = ('control', 'exp', 'initial', 'final')
+
+def _build_ec_standard_card(standard):
+    """Build the static info/tips card HTML for an EC standard."""
+    return f"""
+    <div class='calibration-card' style='border-left-color: {standard["color"]};'>
+        <div class='info-grid'>
+            <div class='info-item'>
+                <strong>📊 Expected Range</strong><br/>
+                {standard['range']}
+            </div>
+            <div class='info-item'>
+                <strong>⏱️ Stability Time</strong><br/>
+                1-2 minutes
+            </div>
+            <div class='info-item'>
+                <strong>🎯 Target Value</strong><br/>
+                {standard['name']}
+            </div>
+        </div>
+
+        <div class='tips-container'>
+            <strong>💡 Important Tips:</strong>
+            <ul>
+                {''.join(f'<li>{tip}</li>' for tip in standard['tips'])}
+            </ul>
         </div>
-    """, unsafe_allow_html=True)
+    """
 
-    ec_data = {}
+# EC standard info/tips cards
+_EC_STANDARD_CARDS = {
+    standard['key']: _build_ec_standard_card(standard)
+    for standard in _EC_STANDARDS
+}
+
+def render_ec_calibration():
+    """Render EC probe calibration form."""
+    st.markdown(_EC_HEADER, unsafe_allow_html=True)
 
     # General Guidelines
     with st.expander("📌 General Calibration Guidelines", expanded=True):
@@ -804,107 +1079,42 @@ def render_ec_calibration():
 
     # Temperature measurement
     st.markdown("### 🌡️ Environmental Conditions")
-    ec_data['temperature'] = st.number_input(
+    st.number_input(
         "Solution Temperature (°C)",
         min_value=10.0,
         max_value=40.0,
         value=25.0,
         step=0.1,
+        key="ec_temperature",
         help="Maintain consistent temperature throughout calibration"
     )
 
-    # EC Standards Configuration
-    standards = [
-        {
-            "name": "84 µS/cm",
-            "key": "84",
-            "color": "#4ECDC4",
-            "range": "80-88 µS/cm",
-            "unit": "µS/cm",
-            "tips": [
-                "Start with this lowest standard",
-                "Essential for low-range accuracy",
-                "Most sensitive to temperature",
-                "Wait for complete stability"
-            ]
-        },
-        {
-            "name": "1413 µS/cm",
-            "key": "1413",
-            "color": "#FFD700",
-            "range": "1390-1436 µS/cm",
-            "unit": "µS/cm",
-            "tips": [
-                "Middle-range standard",
-                "Common measurement range",
-                "Check for consistent response",
-                "Verify temperature compensation"
-            ]
-        },
-        {
-            "name": "12.88 mS/cm",
-            "key": "12880",
-            "color": "#FF6B6B",
-            "range": "12.75-13.01 mS/cm",
-            "unit": "mS/cm",
-            "tips": [
-                "Highest standard solution",
-                "Critical for high-range accuracy",
-                "Ensure complete rinsing from previous standards",
-                "Verify cell constant calculation"
-            ]
-        }
-    ]
-
     # Calibration sections for each standard
-    for standard in standards:
+    for standard in _EC_STANDARDS:
         st.markdown(f"### {standard['name']} Standard")
-        st.markdown(f"""
-            <div class='calibration-card' style='border-left-color: {standard["color"]};'>
-                <div class='info-grid'>
-                    <div class='info-item'>
-                        <strong>📊 Expected Range</strong><br/>
-                        {standard['range']}
-                    </div>
-                    <div class='info-item'>
-                        <strong>⏱️ Stability Time</strong><br/>
-                        1-2 minutes
-                    </div>
-                    <div class='info-item'>
-                        <strong>🎯 Target Value</strong><br/>
-                        {standard['name']}
-                    </div>
-                </div>
-
-                <div class='tips-container'>
-                    <strong>💡 Important Tips:</strong>
-                    <ul>
-                        {''.join(f'<li>{tip}</li>' for tip in standard['tips'])}
-                    </ul>
-                </div>
-            """, unsafe_allow_html=True)
+        st.markdown(_EC_STANDARD_CARDS[standard['key']], unsafe_allow_html=True)
 
         col1, col2 = st.columns(2)
         with col1:
-            ec_data[f"{standard['key']}_control"] = st.text_input(
+            st.text_input(
                 "Control Number",
                 key=f"ec_{standard['key']}_control",
                 help=f"Enter the {standard['name']} solution control number"
             )
-            ec_data[f"{standard['key']}_exp"] = st.date_input(
+            st.date_input(
                 "Solution Expiration Date",
                 key=f"ec_{standard['key']}_exp"
             )
 
         with col2:
-            ec_data[f"{standard['key']}_initial"] = st.number_input(
+            st.number_input(
                 f"Initial Reading ({standard['unit']})",
                 min_value=0.0,
                 step=0.1,
                 key=f"ec_{standard['key']}_initial",
                 help=f"Initial reading for {standard['name']} standard"
             )
-            ec_data[f"{standard['key']}_final"] = st.number_input(
+            final_reading = st.number_input(
                 f"Final Reading ({standard['unit']})",
                 min_value=0.0,
                 step=0.1,
@@ -913,179 +1123,228 @@ def render_ec_calibration():
             )
 
             # Validation warnings
-            if standard['key'] == '84':
-                if not (80 <= ec_data[f"{standard['key']}_final"] <= 88):
-                    st.warning("⚠️ Reading outside acceptable range (80-88 µS/cm)")
-            elif standard['key'] == '1413':
-                if not (1390 <= ec_data[f"{standard['key']}_final"] <= 1436):
-                    st.warning("⚠️ Reading outside acceptable range (1390-1436 µS/cm)")
-            elif standard['key'] == '12880':
-                final_ms = ec_data[f"{standard['key']}_final"]
-                if not (12.75 <= final_ms <= 13.01):
-                    st.warning("⚠️ Reading outside acceptable range (12.75-13.01 mS/cm)")
+            low, high, unit = _EC_VALIDATION_RANGES.get(standard['key'], (None, None, None))
+            if low is not None and not (low <= final_reading <= high):
+                st.warning(f"⚠️ Reading outside acceptable range ({low}-{high} {unit})")
 
         st.markdown("</div>", unsafe_allow_html=True)
 
-    return ec_data
+    # Widgets already hold their values in session state; collect them once
+    return {
+        'temperature': st.session_state['ec_temperature'],
+        **{
+            f"{standard['key']}_{field}": st.session_state[f"ec_{standard['key']}_{field}"]
+            for standard in _EC_STANDARDS
+            for field in _EC_FIELDS
+        }
+    }
+
+# Calibration form renderer per probe type
+_CAL_RENDERERS = {
+    "pH Probe": render_ph_calibration,
+    "DO Probe": render_do_calibration,
+    "ORP Probe": render_orp_calibration,
+    "EC Probe": render_ec_calibration
+}
+
+@st.fragment
+def _calibration_form_fragment(selected_serial, probe_type):
+    """Render the calibration form; submitting it reruns only this fragment."""
+    # Calibration form based on probe type
+    st.markdown("### Calibration Data")
+    calibration_data = None
+
+    try:
+        # Batch widget edits client-side; the fragment reruns only on submit
+        with st.form(f"calibration_form_{selected_serial}", border=False):
+            renderer = _CAL_RENDERERS.get(probe_type)
+            if renderer:
+                calibration_data = renderer()
+            else:
+                st.error(f"Unsupported probe type: {probe_type}")
+
+            col1, col2, col3 = st.columns([2, 1, 1])
+            with col1:
+                save_clicked = st.form_submit_button(
+                    "Save Calibration Data",
+                    type="primary",
+                    disabled=not calibration_data
+                )
+            with col2:
+                st.form_submit_button(
+                    "Check Readings",
+                    disabled=not calibration_data,
+                    help="Apply the entered values and show range warnings without saving"
+                )
+
+        if st.button("Clear Form"):
+            st.session_state.pop('selected_probe', None)
+            st.rerun(scope="app")
+
+        # Save button
+        if save_clicked and calibration_data:
+            # Status flips in memory before the sheet write, so a repeat submit skips it
+            probe = find_probe(selected_serial)
+            if probe is None or probe['Status'] != 'Instock':
+                if probe is not None and probe['Status'] == 'Calibrated':
+                    st.session_state['just_saved'] = selected_serial
+                st.rerun(scope="app")
+
+            with st.spinner("Saving calibration data..."):
+                success = update_probe_calibration(selected_serial, calibration_data)
+            if success:
+                # The probe card and status live outside this fragment
+                st.session_state['just_saved'] = selected_serial
+                st.rerun(scope="app")
+
+    except Exception as e:
+        st.error(f"Error during calibration: {str(e)}")
+        logger.error(f"Calibration error: {str(e)}")
+
+@st.fragment
+def _probe_search_fragment():
+    """Render the probe search panel; keystrokes rerun only this fragment."""
+    st.markdown("### Select Probe")
+    search_query = st.text_input(
+        "🔍 Search by Serial Number or Type",
+        placeholder="Enter Serial Number or Probe Type...",
+        help="Search for a probe to calibrate"
+    ).strip().lower()
+
+    # Very short queries match most of the inventory; skip the scan entirely
+    if len(search_query) < MIN_SEARCH_LENGTH:
+        if search_query:
+            st.caption(f"Type at least {MIN_SEARCH_LENGTH} characters to search.")
+        return
+
+    # Fetched first: an inventory change since the last run drops the remembered matches
+    search_arrays = _search_arrays()
+
+    # Filter only when the query changes; paging and row-selection reruns reuse the matches
+    if st.session_state.get('_match_query') != search_query:
+        indices = search_probe_indices(search_query, _cached_match_candidates(search_query))
+        _remember_matches(search_query, indices)
+        st.session_state['_match_query'] = search_query
+        st.session_state['_match_indices'] = indices
+        # Start from the first page whenever the query changes
+        st.session_state['_match_limit'] = SEARCH_PAGE_SIZE
+
+    matches = st.session_state['_match_indices']
+    if len(matches):
+        match_limit = st.session_state.get('_match_limit', SEARCH_PAGE_SIZE)
+        visible = matches[:match_limit]
+
+        # Gather only the visible rows straight from the cached column arrays
+        st.markdown("#### Matching Probes")
+        results_df = pd.DataFrame({
+            'Serial Number': search_arrays['serial'][visible],
+            'Type': search_arrays['type'][visible],
+            'Status': [
+                _STATUS_BADGES.get(status, f"⚪ {status}")
+                for status in search_arrays['status'][visible]
+            ]
+        })
+
+        # One table element with row selection instead of columns + a button per row
+        selection = st.dataframe(
+            results_df,
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="probe_table"
+        )
+        selected_rows = selection.selection.rows
+        if selected_rows:
+            st.session_state.selected_probe = results_df.iloc[selected_rows[0]]['Serial Number']
+            st.session_state.show_search = False
+            # Escape the fragment so the page renders the calibration form
+            st.rerun(scope="app")
+
+        if len(matches) > len(visible):
+            st.caption(f"Showing {len(visible)} of {len(matches)} matching probes")
+            if st.button(f"Show next {SEARCH_PAGE_SIZE}", key="load_more_probes"):
+                st.session_state['_match_limit'] = match_limit + SEARCH_PAGE_SIZE
+                st.rerun(scope="fragment")
+    else:
+        st.info("No matching probes found.")
+
+def _search_different_probe():
+    """Drop the current selection and reopen the probe search."""
+    st.session_state.show_search = True
+    st.session_state.pop('selected_probe', None)
+
+def display_scraped_probe_info(probe):
+    """Explain that a scraped probe cannot be calibrated."""
+    st.error("❌ This probe has been scraped and cannot be calibrated.")
+
+# Statuses that replace the details card and form with their own panel
+_TERMINAL_STATUS_HANDLERS = {
+    'Shipped': display_shipped_probe_info,
+    'Scraped': display_scraped_probe_info
+}
 
 def calibration_page():
     """Main page for probe calibration."""
     st.markdown('<h1 style="color: #0071ba;">🔍 Probe Calibration</h1>', unsafe_allow_html=True)
+    # Shared stylesheet for every card on this page, sent once per run
+    st.markdown(CALIBRATION_STYLES, unsafe_allow_html=True)
 
     # Initialize inventory manager if needed
     if 'inventory_manager' not in st.session_state:
         st.error("Inventory manager not initialized")
         return
 
+    selected_serial = st.session_state.get('selected_probe')
+    # Set by the calibration form for the single run right after a save
+    just_saved = st.session_state.pop('just_saved', None)
+
     # Show search only if no probe is selected or if user wants to search again
-    if not hasattr(st.session_state, 'selected_probe') or st.session_state.get('show_search', False):
-        st.markdown("### Select Probe")
-        search_query = st.text_input(
-            "🔍 Search by Serial Number or Type",
-            placeholder="Enter Serial Number or Probe Type...",
-            help="Search for a probe to calibrate"
-        ).strip().lower()
-
-        # Get and filter probes
-        probes = get_searchable_probes()
-        if search_query and probes:
-            filtered_probes = [
-                probe for probe in probes
-                if search_query in probe['search_text'].lower()
-            ]
-            
-            if filtered_probes:
-                st.markdown("#### Matching Probes")
-                cols = st.columns([3, 2, 2, 1])
-                cols[0].markdown("**Serial Number**")
-                cols[1].markdown("**Type**")
-                cols[2].markdown("**Status**")
-                st.markdown("---")
-
-                for probe in filtered_probes:
-                    cols = st.columns([3, 2, 2, 1])
-                    with cols[0]:
-                        st.write(probe['serial'])
-                    with cols[1]:
-                        st.write(probe['type'])
-                    with cols[2]:
-                        status_color = {
-                            'Instock': '#FFD700',
-                            'Calibrated': '#90EE90',
-                            'Shipped': '#87CEEB',
-                            'Scraped': '#FFB6C6'
-                        }.get(probe['status'], '#FFFFFF')
-                        st.markdown(f"""
-                            <span style='
-                                background-color: {status_color}40;
-                                padding: 3px 8px;
-                                border-radius: 12px;
-                                font-size: 0.9em;
-                            '>
-                                {probe['status']}
-                            </span>
-                        """, unsafe_allow_html=True)
-                    with cols[3]:
-                        if st.button("Select", key=f"select_{probe['serial']}"):
-                            st.session_state.selected_probe = probe['serial']
-                            st.session_state.show_search = False
-                            st.rerun()
-            else:
-                st.info("No matching probes found.")
+    if selected_serial is None or st.session_state.get('show_search', False):
+        _probe_search_fragment()
 
     # Show calibration form if probe is selected
-    if hasattr(st.session_state, 'selected_probe'):
-        selected_serial = st.session_state.selected_probe
+    if selected_serial is not None:
         probe = find_probe(selected_serial)
         
         # Add a button to search for a different probe
         col1, col2 = st.columns([3, 1])
         with col2:
-            if st.button("🔍 Search Different Probe"):
-                st.session_state.show_search = True
-                del st.session_state.selected_probe
-                st.rerun()
+            # Callbacks run before the next script run, so no extra st.rerun is needed
+            st.button("🔍 Search Different Probe", on_click=_search_different_probe)
         
         if probe is None:
             st.error("❌ Probe not found in inventory.")
             return
 
-        # Display probe information
-        st.markdown(f"""
-            <div style='
-                background-color: #f8f9fa;
-                padding: 15px;
-                border-radius: 8px;
-                margin: 20px 0;
-                border-left: 4px solid #0071ba;
-            '>
-                <h3 style='margin: 0; color: #0071ba;'>Selected Probe Details</h3>
-                <div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-top: 10px;'>
-                    <div>
-                        <strong>Serial Number:</strong> {probe['Serial Number']}<br>
-                        <strong>Type:</strong> {probe['Type']}
-                    </div>
-                    <div>
-                        <strong>Manufacturer:</strong> {probe['Manufacturer']}<br>
-                        <strong>Entry Date:</strong> {probe['Entry Date']}
-                    </div>
-                    <div>
-                        <strong>Status:</strong> {probe['Status']}<br>
-                        <strong>Last Modified:</strong> {probe.get('Last Modified', 'N/A')}
-                    </div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
-
-        # Check probe status
-        if probe['Status'] == 'Shipped':
-            display_shipped_probe_info(probe)
+        # Terminal statuses skip the details card and render their own panel
+        status_handler = _TERMINAL_STATUS_HANDLERS.get(probe['Status'])
+        if status_handler:
+            status_handler(probe)
             return
-            
-        if probe['Status'] == 'Scraped':
-            st.error("❌ This probe has been scraped and cannot be calibrated.")
+
+        # Display probe information with native elements so reruns only diff the values
+        with st.container(border=True):
+            st.markdown("### Selected Probe Details")
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Serial Number", str(probe['Serial Number']))
+            col1.metric("Type", str(probe['Type']))
+            col2.metric("Manufacturer", str(probe['Manufacturer']))
+            col2.metric("Entry Date", str(probe['Entry Date']))
+            col3.metric("Status", str(probe['Status']))
+            col3.metric("Last Modified", str(probe.get('Last Modified', 'N/A')))
+
+        # Confirm the save instead of the "only Instock" guard it would now hit
+        if just_saved == selected_serial:
+            st.success("✅ Calibration data saved successfully!")
             return
-            
+
+        # Check probe status
         if probe['Status'] != 'Instock':
             st.error("❌ Only probes with 'Instock' status can be calibrated.")
             return
 
-        # Calibration form based on probe type
-        st.markdown("### Calibration Data")
-        calibration_data = None
-        
-        try:
-            if probe['Type'] == "pH Probe":
-                calibration_data = render_ph_calibration()
-            elif probe['Type'] == "DO Probe":
-                calibration_data = render_do_calibration()
-            elif probe['Type'] == "ORP Probe":
-                calibration_data = render_orp_calibration()
-            elif probe['Type'] == "EC Probe":
-                calibration_data = render_ec_calibration()
-            else:
-                st.error(f"Unsupported probe type: {probe['Type']}")
-                return
-
-            # Save button
-            if calibration_data:
-                col1, col2, col3 = st.columns([2, 1, 1])
-                with col1:
-                    if st.button("Save Calibration Data", type="primary"):
-                        with st.spinner("Saving calibration data..."):
-                            success = update_probe_calibration(selected_serial, calibration_data)
-                            if success:
-                                st.success("✅ Calibration data saved successfully!")
-                                time.sleep(1)
-                                st.rerun()
-                with col2:
-                    if st.button("Clear Form"):
-                        del st.session_state.selected_probe
-                        st.rerun()
-
-        except Exception as e:
-            st.error(f"Error during calibration: {str(e)}")
-            logger.error(f"Calibration error: {str(e)}")
+        _calibration_form_fragment(selected_serial, probe['Type'])
 
 if __name__ == "__main__":
     calibration_page()
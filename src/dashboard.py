@@ -6,6 +6,41 @@ from datetime import datetime, timedelta
 import pandas as pd
 from .inventory_manager import STATUS_COLORS
 
+# Per-row card templates, filled with str.format for each listed probe
+_UPCOMING_CALIBRATION_CARD = """
+    <div class="stCard" style="border-left: 4px solid {color};">
+        <div style="display: flex; justify-content: space-between;">
+            <div>
+                <strong>{serial}</strong> - {type}<br>
+                <small>Last Calibrated: {last_modified}</small>
+            </div>
+            <div style="text-align: right;">
+                <span style="color: {color}; font-weight: bold;">
+                    {days_until} days remaining
+                </span><br>
+                <small>Due: {due}</small>
+            </div>
+        </div>
+    </div>
+"""
+
+_RECENT_ACTIVITY_CARD = """
+    <div class="stCard" style="border-left: 4px solid {color};">
+        <div style="display: flex; justify-content: space-between;">
+            <div>
+                <strong>{serial}</strong> - {type}<br>
+                <span class="status-badge" style="background-color: {color}20; 
+                                                color: {color}">
+                    {status}
+                </span>
+            </div>
+            <div style="text-align: right;">
+                <small>Modified: {last_modified}</small>
+            </div>
+        </div>
+    </div>
+"""
+
 def render_kpi_metrics(inventory_df):
     """Render the Key Performance Indicators section."""
     total_probes = len(inventory_df)
@@ -114,34 +149,32 @@ def render_calibration_section(inventory_df):
         step=7
     )
     
-    upcoming_cals = inventory_df[
+    # Parse the due dates once and derive days remaining for every probe in one pass
+    now = datetime.now()
+    next_calibration = pd.to_datetime(inventory_df['Next Calibration'])
+    due_mask = (
         (inventory_df['Status'] == 'Calibrated') & 
-        (pd.to_datetime(inventory_df['Next Calibration']) <= datetime.now() + timedelta(days=days_filter))
-    ].sort_values('Next Calibration')
+        (next_calibration <= now + timedelta(days=days_filter))
+    )
+    upcoming_cals = inventory_df[due_mask].assign(
+        days_until=(next_calibration[due_mask] - now).dt.days
+    ).sort_values('Next Calibration')
     
     if not upcoming_cals.empty:
         st.markdown(f"#### Upcoming Calibrations (Next {days_filter} days)")
         
-        for _, row in upcoming_cals.iterrows():
-            days_until = (pd.to_datetime(row['Next Calibration']) - datetime.now()).days
+        for row in upcoming_cals.to_dict('records'):
+            days_until = row['days_until']
             urgency_color = 'var(--error-color)' if days_until <= 7 else 'var(--warning-color)' if days_until <= 14 else 'var(--success-color)'
             
-            st.markdown(f"""
-                <div class="stCard" style="border-left: 4px solid {urgency_color};">
-                    <div style="display: flex; justify-content: space-between;">
-                        <div>
-                            <strong>{row['Serial Number']}</strong> - {row['Type']}<br>
-                            <small>Last Calibrated: {row.get('Last Modified', 'N/A')}</small>
-                        </div>
-                        <div style="text-align: right;">
-                            <span style="color: {urgency_color}; font-weight: bold;">
-                                {days_until} days remaining
-                            </span><br>
-                            <small>Due: {row['Next Calibration']}</small>
-                        </div>
-                    </div>
-                </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_UPCOMING_CALIBRATION_CARD.format(
+                color=urgency_color,
+                serial=row['Serial Number'],
+                type=row['Type'],
+                last_modified=row.get('Last Modified', 'N/A'),
+                days_until=days_until,
+                due=row['Next Calibration']
+            ), unsafe_allow_html=True)
     else:
         st.info("✓ No calibrations due within the selected timeframe")
 
@@ -151,24 +184,15 @@ def render_recent_activity(inventory_df):
     recent_df = inventory_df.sort_values('Last Modified', ascending=False).head(5)
     
     if not recent_df.empty:
-        for _, row in recent_df.iterrows():
+        for row in recent_df.to_dict('records'):
             status_color = STATUS_COLORS.get(row['Status'], '#CCCCCC')
-            st.markdown(f"""
-                <div class="stCard" style="border-left: 4px solid {status_color};">
-                    <div style="display: flex; justify-content: space-between;">
-                        <div>
-                            <strong>{row['Serial Number']}</strong> - {row['Type']}<br>
-                            <span class="status-badge" style="background-color: {status_color}20; 
-                                                            color: {status_color}">
-                                {row['Status']}
-                            </span>
-                        </div>
-                        <div style="text-align: right;">
-                            <small>Modified: {row.get('Last Modified', 'N/A')}</small>
-                        </div>
-                    </div>
-                </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_RECENT_ACTIVITY_CARD.format(
+                color=status_color,
+                serial=row['Serial Number'],
+                type=row['Type'],
+                status=row['Status'],
+                last_modified=row.get('Last Modified', 'N/A')
+            ), unsafe_allow_html=True)
 
 def render_dashboard():
     """Main function to render the dashboard."""
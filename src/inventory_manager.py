@@ -6,7 +6,6 @@ from datetime import datetime, timedelta
 import logging
 import gspread
 from google.oauth2 import service_account
-import json
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +23,10 @@ STATUS_COLORS = {
     'Scraped': '#DC143C'       # Crimson
 }
 
+def mark_inventory_changed():
+    """Bump the session's inventory version so lookups derived from it are rebuilt."""
+    st.session_state['_inventory_version'] = st.session_state.get('_inventory_version', 0) + 1
+
 class InventoryManager:
     def __init__(self):
         """Initialize InventoryManager with Google Sheets connection."""
@@ -64,6 +67,7 @@ class InventoryManager:
                         df[col] = pd.to_datetime(df[col]).dt.strftime('%Y-%m-%d')
                 
                 st.session_state.inventory = df
+                mark_inventory_changed()
                 logger.info(f"Loaded inventory from Google Sheets: {len(df)} records")
         except Exception as e:
             logger.error(f"Error initializing inventory: {str(e)}")
@@ -146,6 +150,44 @@ class InventoryManager:
             st.error(f"Failed to save inventory: {str(e)}")
             return False
 
+    def save_probe(self, inventory_df, serial_number):
+        """Write a single probe's row to Google Sheets, falling back to a full save."""
+        try:
+            if self.worksheet is None:
+                st.error("❌ Cannot save: No connection to Google Sheets")
+                return False
+
+            positions = (inventory_df['Serial Number'] == serial_number).to_numpy().nonzero()[0]
+            if len(positions) != 1:
+                return self.save_inventory(inventory_df)
+
+            # Sheet row 1 is the header; inventory rows are written in order from row 2
+            position = int(positions[0])
+            sheet_row = position + 2
+            headers = inventory_df.columns.tolist()
+
+            # One read confirms the header and target row still line up with the DataFrame
+            sheet_header, sheet_values = self.worksheet.batch_get(['1:1', f'{sheet_row}:{sheet_row}'])
+            sheet_header = sheet_header[0] if sheet_header else []
+            sheet_values = sheet_values[0] if sheet_values else []
+            serial_col = headers.index('Serial Number')
+            if (sheet_header != headers or len(sheet_values) <= serial_col
+                    or sheet_values[serial_col] != str(serial_number)):
+                logger.info("Sheet layout differs from inventory; saving the full inventory")
+                return self.save_inventory(inventory_df)
+
+            row = inventory_df.iloc[[position]].fillna('').values.tolist()
+            self.worksheet.update(f'A{sheet_row}', row)
+
+            st.session_state['last_save_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            logger.info(f"Saved probe {serial_number} to Google Sheets row {sheet_row}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving probe {serial_number}: {str(e)}")
+            st.error(f"Failed to save probe: {str(e)}")
+            return False
+
     def create_backup(self):
         """Create a backup worksheet."""
         try:
@@ -191,9 +233,11 @@ class InventoryManager:
         try:
             if serial_number in st.session_state.inventory['Serial Number'].values:
                 mask = st.session_state.inventory['Serial Number'] == serial_number
+                today = datetime.now().strftime('%Y-%m-%d')
                 st.session_state.inventory.loc[mask, 'Status'] = new_status
-                st.session_state.inventory.loc[mask, 'Change Date'] = datetime.now().strftime('%Y-%m-%d')
-                st.session_state.inventory.loc[mask, 'Last Modified'] = datetime.now().strftime('%Y-%m-%d')
+                st.session_state.inventory.loc[mask, 'Change Date'] = today
+                st.session_state.inventory.loc[mask, 'Last Modified'] = today
+                mark_inventory_changed()
                 
                 return self.save_inventory(st.session_state.inventory)
             return False
@@ -228,9 +272,10 @@ class InventoryManager:
             """Add a new probe to the inventory."""
             try:
                 # Set required dates
-                probe_data['Entry Date'] = datetime.now().strftime('%Y-%m-%d')
-                probe_data['Last Modified'] = datetime.now().strftime('%Y-%m-%d')
-                probe_data['Change Date'] = datetime.now().strftime('%Y-%m-%d')
+                today = datetime.now().strftime('%Y-%m-%d')
+                probe_data['Entry Date'] = today
+                probe_data['Last Modified'] = today
+                probe_data['Change Date'] = today
                 probe_data['Status'] = 'Instock'
                 
                 # Ensure empty calibration data is properly formatted
@@ -262,6 +307,7 @@ class InventoryManager:
                     [st.session_state.inventory, new_row_df],
                     ignore_index=True
                 )
+                mark_inventory_changed()
                 
                 return self.save_inventory(st.session_state.inventory)
             except Exception as e:
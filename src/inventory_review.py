@@ -3,7 +3,6 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
-import json
 import time
 from .inventory_manager import STATUS_COLORS
 
@@ -13,6 +12,44 @@ ESSENTIAL_COLUMNS = [
     "Next Calibration", "Last Modified", "Registered By", "Calibrated By"
 ]
 
+# Static styling for the inventory data editor
+_DATA_EDITOR_STYLES = """
+<style>
+    /* Status cell styling */
+    .stDataFrame td:nth-child(4) {  /* Adjust column number as needed */
+        padding: 0 !important;
+    }
+
+    .status-cell {
+        padding: 4px 8px;
+        border-radius: 12px;
+        text-align: center;
+        font-weight: 500;
+        margin: 2px;
+        display: inline-block;
+        min-width: 100px;
+    }
+
+    /* Status-specific colors */
+    .status-Instock {
+        background-color: rgba(255, 215, 0, 0.2);
+        color: #FFD700;
+    }
+    .status-Calibrated {
+        background-color: rgba(50, 205, 50, 0.2);
+        color: #32CD32;
+    }
+    .status-Shipped {
+        background-color: rgba(65, 105, 225, 0.2);
+        color: #4169E1;
+    }
+    .status-Scraped {
+        background-color: rgba(220, 20, 60, 0.2);
+        color: #DC143C;
+    }
+</style>
+"""
+
 STATUS_INFO = {
     'Instock': {
         'color': '#FFD700',
@@ -133,7 +170,8 @@ def render_advanced_filters(df):
         with col4:
             show_mine = st.checkbox("My Registrations")
 
-    # Apply filters
+    # Apply filters against a single clock reading
+    now = datetime.now()
     filtered_df = df.copy()
     
     if status_filter:
@@ -141,21 +179,21 @@ def render_advanced_filters(df):
     if type_filter:
         filtered_df = filtered_df[filtered_df['Type'].isin(type_filter)]
     if len(date_range) == 2:
+        entry_dates = pd.to_datetime(filtered_df['Entry Date']).dt.date
         filtered_df = filtered_df[
-            (pd.to_datetime(filtered_df['Entry Date']).dt.date >= date_range[0]) &
-            (pd.to_datetime(filtered_df['Entry Date']).dt.date <= date_range[1])
+            (entry_dates >= date_range[0]) & (entry_dates <= date_range[1])
         ]
     if show_expired:
         filtered_df = filtered_df[
-            pd.to_datetime(filtered_df['Next Calibration']) <= datetime.now()
+            pd.to_datetime(filtered_df['Next Calibration']) <= now
         ]
     if show_recent:
         filtered_df = filtered_df[
-            pd.to_datetime(filtered_df['Last Modified']) >= datetime.now() - timedelta(days=7)
+            pd.to_datetime(filtered_df['Last Modified']) >= now - timedelta(days=7)
         ]
     if show_critical:
         mask = (filtered_df['Status'] == 'Instock') | (
-            pd.to_datetime(filtered_df['Next Calibration']) <= datetime.now() + timedelta(days=7)
+            pd.to_datetime(filtered_df['Next Calibration']) <= now + timedelta(days=7)
         )
         filtered_df = filtered_df[mask]
     if show_mine:
@@ -221,42 +259,7 @@ def render_inventory_table(filtered_df):
     }
 
     # Custom styling for the data editor
-    st.markdown("""
-        <style>
-            /* Status cell styling */
-            .stDataFrame td:nth-child(4) {  /* Adjust column number as needed */
-                padding: 0 !important;
-            }
-            
-            .status-cell {
-                padding: 4px 8px;
-                border-radius: 12px;
-                text-align: center;
-                font-weight: 500;
-                margin: 2px;
-                display: inline-block;
-                min-width: 100px;
-            }
-            
-            /* Status-specific colors */
-            .status-Instock {
-                background-color: rgba(255, 215, 0, 0.2);
-                color: #FFD700;
-            }
-            .status-Calibrated {
-                background-color: rgba(50, 205, 50, 0.2);
-                color: #32CD32;
-            }
-            .status-Shipped {
-                background-color: rgba(65, 105, 225, 0.2);
-                color: #4169E1;
-            }
-            .status-Scraped {
-                background-color: rgba(220, 20, 60, 0.2);
-                color: #DC143C;
-            }
-        </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_DATA_EDITOR_STYLES, unsafe_allow_html=True)
 
     # Render table
     edited_df = st.data_editor(
@@ -268,8 +271,9 @@ def render_inventory_table(filtered_df):
                  "Next Calibration", "Registered By", "Calibrated By"]
     )
 
-    # Handle actions
-    for idx, row in edited_df.iterrows():
+    # Handle actions; only rows whose Action was changed from the default need work
+    pending_actions = edited_df[edited_df['Action'] != 'Select']
+    for idx, row in pending_actions.to_dict('index').items():
         if row['Action'] == 'Calibrate':
             st.session_state.selected_probe = row['Serial Number']
             st.session_state.page = "Probe Calibration"
@@ -1,7 +1,6 @@
 # src/registration_page.py
 
 import streamlit as st
-import pandas as pd
 from datetime import datetime, timedelta
 import logging
 import time
@@ -27,6 +26,78 @@ SERVICE_LIFE = {
     "EC Probe": 10,
 }
 
+# Static styling for the serial number card, its print layout and the Register button
+_REGISTRATION_STYLES = """
+<style>
+    .serial-container {
+        background: white;
+        border-radius: 10px;
+        padding: 20px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        margin: 20px 0;
+    }
+    .serial-number {
+        color: #0071ba;
+        font-size: 24px;
+        font-weight: bold;
+        font-family: monospace;
+        padding: 10px;
+        background: #f8f9fa;
+        border-radius: 5px;
+        margin: 10px 0;
+    }
+    .print-button {
+        background: #0071ba;
+        color: white;
+        padding: 8px 16px;
+        border-radius: 5px;
+        border: none;
+        cursor: pointer;
+        display: inline-flex;
+        align-items: center;
+        gap: 8px;
+    }
+    .print-button:hover {
+        background: #005999;
+    }
+    @media print {
+        body * {
+            visibility: hidden;
+        }
+        #printable-content, #printable-content * {
+            visibility: visible;
+        }
+        #printable-content {
+            position: absolute;
+            left: 0;
+            top: 0;
+            width: 2.25in;
+            height: 1.25in;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }
+        .print-serial {
+            font-family: monospace;
+            font-size: 16pt;
+            font-weight: bold;
+        }
+    }
+    .stButton > button {
+        background: #0071ba;
+        color: white;
+        font-weight: 500;
+        padding: 0.5rem 1rem;
+        width: 100%;
+        transition: all 0.3s ease;
+    }
+    .stButton > button:hover {
+        background: #005999;
+        transform: translateY(-2px);
+    }
+</style>
+"""
+
 def registration_page():
     """Main page for probe registration"""
     
@@ -54,64 +125,8 @@ def registration_page():
     serial_number = st.session_state.inventory_manager.get_next_serial_number(probe_type, manufacturing_date)
     
     # Display Serial Number with Print Button
+    st.markdown(_REGISTRATION_STYLES, unsafe_allow_html=True)
     st.markdown(f"""
-        <style>
-            .serial-container {{
-                background: white;
-                border-radius: 10px;
-                padding: 20px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                margin: 20px 0;
-            }}
-            .serial-number {{
-                color: #0071ba;
-                font-size: 24px;
-                font-weight: bold;
-                font-family: monospace;
-                padding: 10px;
-                background: #f8f9fa;
-                border-radius: 5px;
-                margin: 10px 0;
-            }}
-            .print-button {{
-                background: #0071ba;
-                color: white;
-                padding: 8px 16px;
-                border-radius: 5px;
-                border: none;
-                cursor: pointer;
-                display: inline-flex;
-                align-items: center;
-                gap: 8px;
-            }}
-            .print-button:hover {{
-                background: #005999;
-            }}
-            @media print {{
-                body * {{
-                    visibility: hidden;
-                }}
-                #printable-content, #printable-content * {{
-                    visibility: visible;
-                }}
-                #printable-content {{
-                    position: absolute;
-                    left: 0;
-                    top: 0;
-                    width: 2.25in;
-                    height: 1.25in;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                }}
-                .print-serial {{
-                    font-family: monospace;
-                    font-size: 16pt;
-                    font-weight: bold;
-                }}
-            }}
-        </style>
-
         <div class="serial-container">
             <div>Generated Serial Number:</div>
             <div class="serial-number">{serial_number}</div>
@@ -165,30 +180,13 @@ def registration_page():
         </script>
     """, unsafe_allow_html=True)
 
-    # Save Button with improved styling
-    st.markdown("""
-        <style>
-            .stButton > button {
-                background: #0071ba;
-                color: white;
-                font-weight: 500;
-                padding: 0.5rem 1rem;
-                width: 100%;
-                transition: all 0.3s ease;
-            }
-            .stButton > button:hover {
-                background: #005999;
-                transform: translateY(-2px);
-            }
-        </style>
-    """, unsafe_allow_html=True)
-
     if st.button("Register Probe", type="primary"):
         if not all([manufacturer, manufacturer_part_number, ketos_part_number]):
             st.error("❌ Please fill in all required fields.")
             return
 
         # Prepare probe data
+        today = datetime.now().strftime("%Y-%m-%d")
         probe_data = {
             "Serial Number": serial_number,
             "Type": probe_type,
@@ -196,9 +194,9 @@ def registration_page():
             "KETOS P/N": ketos_part_number,
             "Mfg P/N": manufacturer_part_number,
             "Status": "Instock",
-            "Entry Date": datetime.now().strftime("%Y-%m-%d"),
-            "Last Modified": datetime.now().strftime("%Y-%m-%d"),
-            "Change Date": datetime.now().strftime("%Y-%m-%d"),
+            "Entry Date": today,
+            "Last Modified": today,
+            "Change Date": today,
             "Calibration Data": {},
             "Registered By": st.session_state.get('username', 'Unknown'),
             "Calibrated By": "",  